@@ -1,22 +1,38 @@
 #!/usr/bin/env python3
 
+import json
 import logging
 import os
 import re
 import shutil
+import struct
 import subprocess
+import time
 
 import piexif
 from halo import Halo
-from PIL import Image
 
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-
-# Parse format: YYYYMMDD
-REGEX_FILENAME_DATE = r'(?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})'
-REGEX_EXIF_DATE = r'((\d{4}):(\d{2}):(\d{2}))'
-REGEX_EXIF_TIME = r'((\d{2}):(\d{2}):(\d{2}))'
+from functools import partial
+from multiprocessing import Pool
+
+# Parse format: YYYYMMDD (Android, e.g. IMG-20230415-WA0001.jpg) or
+# YYYY-MM-DD (iOS, e.g. PHOTO-2023-04-15-at-10.30.15.jpeg), with an optional
+# "at HH.MM.SS" time later in the name. Compiled once at import; one search
+# covers both date and time. The bounded digit classes reject 8-digit runs
+# that are not dates (phone numbers, hashes) instead of mis-parsing them.
+_FILENAME_DT_RE = re.compile(
+    r'(?P<year>19[89]\d|20\d\d)(?P<sep>[-._ ]?)'
+    r'(?P<month>0[1-9]|1[0-2])(?P=sep)'
+    r'(?P<day>0[1-9]|[12]\d|3[01])'
+    r'(?:.*?at[-. ](?P<hour>[01]\d|2[0-3])\.(?P<minute>[0-5]\d)\.(?P<second>[0-5]\d))?'
+)
+# EXIF date format is "YYYY:MM:DD HH:MM:SS". A bytes pattern, so tag values
+# are matched as-is without a UTF-8 decode per value.
+_EXIF_DT_RE = re.compile(rb'\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}')
 FILES_EXT = ['jpeg', 'jpg', 'mp4']
 VIDEO_EXT = ['mp4']
 IMAGE_EXT = ['jpeg', 'jpg']
@@ -24,7 +40,9 @@ IMAGE_EXT = ['jpeg', 'jpg']
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# slots=True drops the per-instance __dict__; with one File per media file on
+# big runs that is a meaningful memory saving and faster attribute access.
+@dataclass(slots=True)
 class File:
     filename: str = ''
     file_path: str = ''
@@ -33,6 +51,7 @@ class File:
     parsed_date: str = ''
     exif_bytes: bytes = b''
     relative_dir: str = ''  # Subdirectory path relative to input_path
+    cache_key: str = ''  # Scan-cache key, set when the file is dispatched
 
     def __repr__(self):
         return f'Filename: {self.filename}'
@@ -56,48 +75,131 @@ def parse_arguments():
     return args
 
 
-def get_files_from_path(path, recursive=False, output_path=''):
+# Number of threads reading directories concurrently in recursive mode.
+_SCAN_WORKERS = 8
+
+
+def _scan_dir(path):
+    """Read one directory, splitting entries into files and subdirectories."""
     files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    files.append(entry)
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError as e:
+        # Match os.walk's default behavior: skip unreadable directories
+        # instead of letting one of them abort the whole run.
+        logger.warning(f"Could not read directory '{path}': {e}")
+    return path, files, subdirs
+
+
+def _iter_entries(path, recursive=False):
+    """
+    Yield (DirEntry, parent_dir) pairs for files under path using os.scandir.
+
+    DirEntry carries the file type returned by the directory read itself, so
+    filtering files costs no extra stat() syscall per entry, unlike the
+    os.walk + os.path.isfile combination. In recursive mode, directory reads
+    go through a small thread pool breadth-first: each read is a blocking
+    syscall that releases the GIL, so overlapping them hides per-directory
+    latency on deep trees.
+    """
+    if not recursive:
+        _, files, _ = _scan_dir(path)
+        for entry in files:
+            yield entry, path
+        return
+
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+        pending = deque([executor.submit(_scan_dir, path)])
+        while pending:
+            dir_path, files, subdirs = pending.popleft().result()
+            for subdir in subdirs:
+                pending.append(executor.submit(_scan_dir, subdir))
+            for entry in files:
+                yield entry, dir_path
+
+
+def get_files_from_path(path, recursive=False, output_path=''):
+    """
+    Yield File objects for supported media under path.
+
+    A generator rather than a list, so processing can start while the
+    directory walk is still running and memory stays bounded regardless of
+    tree size.
+    """
     path = os.path.abspath(path)
-    
-    if recursive:
-        file_paths = [(os.path.join(root, file), root) for root, _, files_in_dir in os.walk(path) for file in files_in_dir]
-    else:
-        file_paths = [(os.path.join(path, file), path) for file in os.listdir(path) if os.path.isfile(os.path.join(path, file))]
-    
-    for file_path, root_dir in file_paths:
-        filename = os.path.basename(file_path)
-        extension = os.path.splitext(filename)[1][1:].lower()
+    # Every root_dir below starts with path + os.sep, so the relative
+    # directory is a plain slice - no relpath normalization needed.
+    prefix_len = len(path) + 1
+
+    current_root = None
+    relative_dir = ''
+    out_dir = ''
+
+    for entry, root_dir in _iter_entries(path, recursive):
+        if root_dir != current_root:
+            # Entries arrive grouped by directory; derive the relative and
+            # output directories once per directory, not once per file.
+            current_root = root_dir
+            relative_dir = root_dir[prefix_len:]
+            if output_path:
+                out_dir = output_path + os.sep + relative_dir if relative_dir else output_path
+
+        filename = entry.name
+        extension = filename.rpartition('.')[2].lower()
         if extension in FILES_EXT:
-            # Calculate relative directory from input path
-            relative_dir = os.path.relpath(root_dir, path)
-            if relative_dir == '.':
-                relative_dir = ''
-            
-            new_file_path = os.path.join(output_path, relative_dir, filename) if output_path else ''
-            files.append(File(
+            yield File(
                 filename=filename,
-                file_path=str(file_path),
-                new_file_path=new_file_path,
+                file_path=entry.path,
+                new_file_path=out_dir + os.sep + filename if output_path else '',
                 extension=extension,
                 parsed_date='',
                 exif_bytes=b'',
                 relative_dir=relative_dir
-            ))
-    
-    return files
+            )
 
 
-def export_exif_data(file: File):
-    with open(file.file_path, 'rb') as f:
-        im = Image.open(f)
-        exif_data = im.info.get("exif")
-        data = None
+# EXIF sits in the APP1 segment near the start of the file; 128KB covers it
+# in practice even for files with large thumbnails.
+_APP1_SCAN_BYTES = 128 * 1024
 
-        if exif_data:
-            data = piexif.load(exif_data).get('Exif')
 
-    return data
+def _read_app1(path):
+    """
+    Return the EXIF payload of a JPEG's APP1 segment, or None.
+
+    Walks the segment markers in the file head manually instead of handing
+    the file to Pillow, so checking for an existing EXIF date never decodes
+    pixels or reads past the metadata segments. The returned bytes keep the
+    leading 'Exif\\x00\\x00' signature, which piexif.load accepts directly.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(_APP1_SCAN_BYTES)
+
+    if head[:2] != b'\xff\xd8':
+        return None
+
+    offset = 2
+    while offset + 4 <= len(head):
+        if head[offset] != 0xFF:
+            return None
+        marker = head[offset + 1]
+        # APPn (0xE0-0xEF) and COM (0xFE) are the only segments EXIF can hide
+        # behind; anything else means image data is next.
+        if not (0xE0 <= marker <= 0xEF or marker == 0xFE):
+            return None
+        (length,) = struct.unpack('>H', head[offset + 2:offset + 4])
+        payload = head[offset + 4:offset + 2 + length]
+        if marker == 0xE1 and payload[:6] == b'Exif\x00\x00':
+            return payload
+        offset += 2 + length
+
+    return None
 
 
 def check_exif(file: File):
@@ -106,41 +208,124 @@ def check_exif(file: File):
     :param file: File object with file_path.
     :return: True if file has EXIF date data, False otherwise.
     """
-    data = export_exif_data(file)
+    return check_exif_from_bytes(_read_app1(file.file_path))
+
+
+def check_exif_from_bytes(exif_bytes):
+    """
+    Check already-read EXIF bytes for date data, avoiding a second file read
+    when the caller holds the APP1 payload.
+    :param exif_bytes: Raw APP1 payload from _read_app1, or None.
+    :return: True if the EXIF data contains a date, False otherwise.
+    """
+    data = piexif.load(exif_bytes).get('Exif') if exif_bytes else None
 
     if data:
-        # EXIF date format is "YYYY:MM:DD HH:MM:SS"
-        exif_date_pattern = r'\d{4}:\d{2}:\d{2} \d{2}:\d{2}:\d{2}'
         for tag_id, value in data.items():
-            if isinstance(value, bytes):
-                try:
-                    decoded_value = value.decode('utf-8')
-                    if re.search(exif_date_pattern, decoded_value):
-                        logger.debug(f'Found EXIF date: {decoded_value}')
-                        return True
-                except UnicodeDecodeError:
-                    continue
+            # Structural pre-check before the regex: EXIF date strings are
+            # "YYYY:MM:DD HH:MM:SS", so anything shorter than 19 bytes or
+            # without ':' after the year can be rejected with two C-level
+            # bytes operations.
+            if isinstance(value, bytes) and len(value) >= 19 and value[4:5] == b':' \
+                    and _EXIF_DT_RE.search(value):
+                logger.debug(f'Found EXIF date: {value!r}')
+                return True
     return False
 
 
+# Results of previous EXIF scans, persisted in the output tree so re-runs
+# over an unchanged library skip the file reads entirely.
+CACHE_FILENAME = '.whatsapp-exif-cache.json'
+
+
+def _cache_key(file):
+    """Key a file by path, mtime and size; any change invalidates the entry."""
+    try:
+        st = os.stat(file.file_path)
+    except OSError:
+        return ''
+    return f'{file.file_path}|{st.st_mtime_ns}|{st.st_size}'
+
+
+def _load_cache(output_path):
+    """Load the EXIF scan cache from a previous run, or an empty dict."""
+    try:
+        with open(os.path.join(output_path, CACHE_FILENAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(output_path, cache):
+    """Persist the EXIF scan cache for the next run."""
+    try:
+        os.makedirs(output_path, exist_ok=True)
+        with open(os.path.join(output_path, CACHE_FILENAME), 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.warning(f"Could not write EXIF cache: {e}")
+
+
+def _fast_parse_date(filename):
+    """
+    Fast path for the dominant Android pattern ...-YYYYMMDD-... (e.g.
+    IMG-20230415-WA0001.jpg): a couple of str.find and slice operations beat
+    the regex by an order of magnitude. Returns (year, month, day) or None;
+    anything it cannot settle confidently falls back to the regex.
+    """
+    best = None
+    for token in ('-20', '-19'):
+        i = filename.find(token)
+        if i < 0 or (best is not None and i > best[0]):
+            continue
+        candidate = filename[i + 1:i + 9]
+        if len(candidate) != 8 or not candidate.isdigit():
+            continue
+        year, month, day = candidate[0:4], candidate[4:6], candidate[6:8]
+        # Mirror the regex bounds; names carrying a time suffix go through
+        # the regex so the time is not silently dropped.
+        if (token == '-19' and year[2] not in '89') \
+                or not '01' <= month <= '12' \
+                or not '01' <= day <= '31' \
+                or 'at' in filename[i + 9:]:
+            continue
+        best = (i, (year, month, day))
+
+    if best is None:
+        return None
+
+    # The regex takes the leftmost date-like run, dashed or not; if a '19' or
+    # '20' appears before our candidate's year, let the regex decide so the
+    # fast path never returns a different answer than the fallback.
+    for prefix in ('20', '19'):
+        j = filename.find(prefix)
+        if 0 <= j < best[0] + 1:
+            return None
+    return best[1]
+
+
 def parse_filename_to_date(file):
     """ Parse and return date and time from the filename. """
-    date_match = re.search(REGEX_FILENAME_DATE, file.filename)
-    time_match = re.search(r'at (\d{2})\.(\d{2})\.(\d{2})', file.filename)
-    
-    if date_match:
-        date_dict = date_match.groupdict()
-        date_str = f"{date_dict['year']}:{date_dict['month']}:{date_dict['day']}"
-        
-        if time_match:
-            hour, minute, second = time_match.groups()
-            time_str = f"{hour}:{minute}:{second}"
+    fast = _fast_parse_date(file.filename)
+    if fast:
+        year, month, day = fast
+        file.parsed_date = f"{year}:{month}:{day} 00:00:00"
+        logger.debug(f'Parsed date: {file.parsed_date}')
+        return file
+
+    match = _FILENAME_DT_RE.search(file.filename)
+
+    if match:
+        date_str = f"{match['year']}:{match['month']}:{match['day']}"
+
+        if match['hour']:
+            time_str = f"{match['hour']}:{match['minute']}:{match['second']}"
         else:
             time_str = "00:00:00"
-        
+
         file.parsed_date = f"{date_str} {time_str}"
         logger.debug(f'Parsed date: {file.parsed_date}')
-    
+
     return file
 
 def new_image_exif_data(file):
@@ -161,127 +346,337 @@ def check_exiftool():
     return shutil.which('exiftool') is not None
 
 
-def save_video_exif_data(file, output_path, overwrite):
-    """Save EXIF data to video files using exiftool."""
+class ExifToolDaemon:
+    """
+    Persistent exiftool process using its -stay_open batch mode.
+
+    Spawning a fresh exiftool per file pays the perl interpreter startup cost
+    (~300ms) every time; keeping one process alive and feeding it commands over
+    stdin amortizes that cost across the whole run.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._counter = 0
+
+    def start(self):
+        # Merge stderr into stdout so error text (bad tag value, unwritable
+        # file, ...) is captured with the command output instead of lost.
+        self._proc = subprocess.Popen(
+            ['exiftool', '-stay_open', 'True', '-@', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+        return self
+
+    def execute(self, *args):
+        """
+        Run one exiftool command in the persistent process.
+        :param args: Command-line arguments, one per element (no shell quoting).
+        :return: exiftool's stdout output for this command.
+        """
+        self._counter += 1
+        tag = str(self._counter)
+        block = ''.join(f'{arg}\n' for arg in args) + f'-execute{tag}\n'
+        self._proc.stdin.write(block.encode('utf-8'))
+        self._proc.stdin.flush()
+
+        sentinel = f'{{ready{tag}}}'.encode('utf-8')
+        output_lines = []
+        while True:
+            line = self._proc.stdout.readline()
+            if not line:
+                raise RuntimeError('exiftool process terminated unexpectedly')
+            if line.strip() == sentinel:
+                break
+            output_lines.append(line)
+        return b''.join(output_lines).decode('utf-8', errors='replace')
+
+    def stop(self):
+        if self._proc is None:
+            return
+        try:
+            self._proc.stdin.write(b'-stay_open\nFalse\n')
+            self._proc.stdin.flush()
+            self._proc.communicate(timeout=10)
+        except Exception:
+            self._proc.kill()
+        self._proc = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+# Output directories created this run. makedirs stats every component of the
+# path, so the callers go through _ensure_output_dir to pay that once per
+# directory instead of once per file.
+_created_dirs = set()
+
+
+def _ensure_output_dir(output_path, relative_dir):
+    """Create (once) and return the output directory for a relative subdir."""
+    target_dir = output_path + os.sep + relative_dir if relative_dir else output_path
+    if target_dir not in _created_dirs:
+        os.makedirs(target_dir, exist_ok=True)
+        _created_dirs.add(target_dir)
+    return target_dir
+
+
+def copy_video(file, output_path, overwrite):
+    """Copy a video into the output tree. Returns the target path, or None if skipped."""
     target_dir = os.path.join(output_path, file.relative_dir) if file.relative_dir else output_path
-    os.makedirs(target_dir, exist_ok=True)
     new_file_path = os.path.join(target_dir, file.filename)
-    
+
     if os.path.exists(new_file_path):
         if not overwrite:
             logger.debug(f"Skipping '{file.filename}' - already exists")
             return None
         os.remove(new_file_path)
-    
-    # Copy file to output location first
-    shutil.copy2(file.file_path, new_file_path)
-    
-    # Use exiftool to set the date metadata
-    cmd = [
-        'exiftool',
+
+    # copyfile, not copy2: exiftool overwrites the dates anyway, and copyfile
+    # takes the zero-copy sendfile path on Linux.
+    shutil.copyfile(file.file_path, new_file_path)
+    return new_file_path
+
+
+def save_video_exif_data(file, daemon):
+    """Write the parsed date into an already-copied video via the persistent exiftool process."""
+    output = daemon.execute(
         '-overwrite_original',
         f'-CreateDate={file.parsed_date}',
         f'-ModifyDate={file.parsed_date}',
         f'-MediaCreateDate={file.parsed_date}',
         f'-MediaModifyDate={file.parsed_date}',
-        new_file_path
-    ]
-    
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        file.new_file_path = new_file_path
+        file.new_file_path
+    )
+
+    if '1 image files updated' in output:
         logger.debug(f"Video saved: {file.new_file_path}")
         return file
-    except subprocess.CalledProcessError as e:
-        logger.error(f"exiftool failed: {e.stderr}")
-        os.remove(new_file_path)
-        return None
+
+    logger.error(f"exiftool failed: {output.strip()}")
+    os.remove(file.new_file_path)
+    return None
 
 
-def save_exif_data(file, img, output_path, overwrite):
+def save_exif_data(file, output_path, overwrite):
+    # The main process pre-creates the directory before dispatching the file.
     target_dir = os.path.join(output_path, file.relative_dir) if file.relative_dir else output_path
-    os.makedirs(target_dir, exist_ok=True)
     new_file_path = os.path.join(target_dir, file.filename)
-    
+
     if os.path.exists(new_file_path):
         if not overwrite:
             logger.debug(f"Skipping '{file.filename}' - already exists")
-            img.close()
             return None
         os.remove(new_file_path)
-    
-    img.save(new_file_path, exif=file.exif_bytes)
-    img.close()
-    
+
+    # Splice the APP1 segment into a byte-for-byte copy of the source JPEG;
+    # the pixel stream is never decoded or re-encoded.
+    piexif.insert(file.exif_bytes, file.file_path, new_file_path)
+
     file.new_file_path = new_file_path
     logger.debug(f"Image saved: {file.new_file_path}")
-    
-    # Verify using the new file path
-    saved_file = File(
-        filename=file.filename,
-        file_path=new_file_path,
-        new_file_path=new_file_path,
-        extension=file.extension
-    )
-    if not check_exif(saved_file):
+
+    # Verify against the bytes we just wrote; no need to re-read and re-parse
+    # the saved file from disk.
+    if not _verify_exif_bytes(file.exif_bytes):
         logger.warning(f"Warning: EXIF verification failed for '{new_file_path}'")
 
     return file
 
+
+def _verify_exif_bytes(exif_bytes):
+    """Check that dumped EXIF bytes carry a DateTimeOriginal tag."""
+    try:
+        exif = piexif.load(exif_bytes).get('Exif', {})
+    except Exception:
+        return False
+    return piexif.ExifIFD.DateTimeOriginal in exif
+
 def main():
     args = parse_arguments()
     spinner = Halo(text='Retrieving list of media files...\n', spinner='dots')
     spinner.start()
-    files_list = get_files_from_path(path=args.input_path, recursive=args.recursive)
-
-    for file in files_list:
-        if isinstance(file, str):
-            file = File(filename=os.path.basename(file), file_path=file)
-        
-        spinner.text = f'Processing: {file.filename}'
-        
-        try:
-            process_file(file, args, spinner)
-        except Exception as e:
-            spinner.info(f"An error occurred: {str(e)}")
-    
+
+    # Fail fast on an unusable output root instead of erroring per file.
+    try:
+        os.makedirs(args.output_path, exist_ok=True)
+    except OSError as e:
+        spinner.fail(f"Cannot create output path '{args.output_path}': {e}")
+        return
+
+    files_iter = get_files_from_path(path=args.input_path, recursive=args.recursive)
+
+    video_files = []
+
+    def image_stream():
+        # Divert videos into a list for the batch pass; images stream straight
+        # to the worker pool as the walk discovers them.
+        for file in files_iter:
+            if file.extension in VIDEO_EXT:
+                video_files.append(file)
+            else:
+                yield file
+
+    cache = _load_cache(args.output_path)
+    process_images(image_stream(), args, spinner, cache)
+
+    if video_files:
+        process_videos(video_files, args, spinner)
+
+    _save_cache(args.output_path, cache)
     spinner.succeed("Run complete.")
 
 
-def process_file(file, args, spinner):
-    is_video = file.extension in VIDEO_EXT
-    
-    # For images, check existing EXIF; for videos, skip this check (exiftool handles it)
-    if not is_video and check_exif(file=file):
-        spinner.info(f"Skipping file: '{file.filename}' - already has EXIF date")
-        return
+def process_images(image_files, args, spinner, cache):
+    """Process images in parallel; each image is independent, so a worker pool scales with core count."""
+    worker = partial(_process_image, output_path=args.output_path, overwrite=args.overwrite)
 
-    file = parse_filename_to_date(file=file)
-    if not file.parsed_date:
-        spinner.warn(f"Skipping file: '{file.filename}' - no date found in filename")
-        return
+    def dispatch():
+        # Attach the scan cache state in the main process; known results make
+        # the worker short-circuit without any I/O. This generator runs on the
+        # pool's task-feeder thread, so it must not touch the spinner - all
+        # reporting happens in the result loop below.
+        for file in image_files:
+            file.cache_key = _cache_key(file)
+            known_has_exif = cache.get(file.cache_key) if file.cache_key else None
+            if not known_has_exif:
+                try:
+                    _ensure_output_dir(args.output_path, file.relative_dir)
+                except OSError as e:
+                    # Let the worker's save attempt surface this as a
+                    # per-file error; raising here would kill the pool.
+                    logger.warning(f"Could not create output directory for '{file.filename}': {e}")
+            yield file, known_has_exif
+
+    progress = _SpinnerThrottle(spinner)
+    with Pool(os.cpu_count()) as pool:
+        for file, status, detail in pool.imap_unordered(worker, dispatch(), chunksize=16):
+            progress.update(f'Processing: {file.filename}')
+            if file.cache_key:
+                if status == 'has_exif':
+                    cache[file.cache_key] = True
+                elif status in ('saved', 'exists'):
+                    cache[file.cache_key] = False
+            if status == 'saved':
+                spinner.succeed(f"{file.filename} → {detail}")
+            elif status == 'has_exif':
+                spinner.info(f"Skipping file: '{file.filename}' - already has EXIF date")
+            elif status == 'no_date':
+                spinner.warn(f"Skipping file: '{file.filename}' - no date found in filename")
+            elif status == 'not_jpeg':
+                spinner.warn(f"Skipping file: '{file.filename}' - not a valid JPEG")
+            elif status == 'error':
+                spinner.info(f"An error occurred: '{file.filename}': {detail}")
+
+
+def _process_image(item, output_path, overwrite):
+    """
+    Process a single image. Runs in a worker process, so it must stay picklable
+    and cannot touch the spinner; returns (file, status, detail) tuples for the
+    main process to report. item is (file, known_has_exif), where the second
+    element carries a cached check result (or None for a cache miss).
+    """
+    file, known_has_exif = item
+    try:
+        # A cached positive needs no work at all, not even a file open.
+        if known_has_exif:
+            return file, 'has_exif', ''
+
+        # Filename parsing is pure string work; do it first so files without
+        # a date in the name are skipped without ever being opened.
+        file = parse_filename_to_date(file=file)
+        if not file.parsed_date:
+            return file, 'no_date', ''
+
+        if known_has_exif is None and check_exif(file=file):
+            return file, 'has_exif', ''
 
-    if is_video:
-        if not check_exiftool():
-            spinner.fail(f"Skipping video '{file.filename}' - exiftool not installed")
-            return
-        result = save_video_exif_data(
-            file=file,
-            output_path=args.output_path,
-            overwrite=args.overwrite
-        )
-    else:
-        im = Image.open(file.file_path)
         file, exif = new_image_exif_data(file=file)
         result = save_exif_data(
             file=file,
-            img=im,
-            output_path=args.output_path,
-            overwrite=args.overwrite
+            output_path=output_path,
+            overwrite=overwrite
         )
-    
-    if result:
-        spinner.succeed(f"{file.filename} → {file.parsed_date}")
+        if result:
+            return file, 'saved', file.parsed_date
+        return file, 'exists', ''
+    except (piexif.InvalidImageDataError, ValueError):
+        # A .jpg extension on non-JPEG bytes (PNG, WebP, ...); piexif cannot
+        # splice into those, and InvalidImageDataError stringifies to ''.
+        return file, 'not_jpeg', ''
+    except Exception as e:
+        return file, 'error', str(e) or repr(e)
+
+
+# Threads copying videos ahead of the exiftool pass.
+_COPY_WORKERS = 4
+
+# Throttle for plain progress-text updates: every redraw costs terminal I/O
+# (several ms on slow TTYs), which dominates wall time for tiny files.
+_SPINNER_EVERY_FILES = 50
+_SPINNER_EVERY_SECS = 0.25
+
+
+class _SpinnerThrottle:
+    """Rate-limit spinner.text updates; final statuses stay unthrottled."""
+
+    def __init__(self, spinner):
+        self._spinner = spinner
+        self._count = 0
+        self._last = 0.0
+
+    def update(self, text):
+        self._count += 1
+        now = time.monotonic()
+        if self._count >= _SPINNER_EVERY_FILES or now - self._last >= _SPINNER_EVERY_SECS:
+            self._spinner.text = text
+            self._count = 0
+            self._last = now
+
+
+def process_videos(video_files, args, spinner):
+    """Process all videos as one batch, prefetching copies on a thread pool while exiftool consumes them."""
+    if not check_exiftool():
+        spinner.fail(f"Skipping {len(video_files)} video(s) - exiftool not installed")
+        return
+
+    to_copy = []
+    for file in video_files:
+        file = parse_filename_to_date(file=file)
+        if not file.parsed_date:
+            spinner.warn(f"Skipping file: '{file.filename}' - no date found in filename")
+            continue
+        try:
+            _ensure_output_dir(args.output_path, file.relative_dir)
+        except OSError as e:
+            spinner.info(f"An error occurred: '{file.filename}': {e}")
+            continue
+        to_copy.append(file)
+
+    # The copy threads run a few files ahead of the metadata writes, so disk
+    # I/O overlaps with exiftool instead of serializing with it.
+    progress = _SpinnerThrottle(spinner)
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor, ExifToolDaemon() as daemon:
+        copies = [
+            (file, executor.submit(copy_video, file, args.output_path, args.overwrite))
+            for file in to_copy
+        ]
+        for file, future in copies:
+            progress.update(f'Writing metadata: {file.filename}')
+            try:
+                new_file_path = future.result()
+                if new_file_path is None:
+                    continue
+                file.new_file_path = new_file_path
+                if save_video_exif_data(file=file, daemon=daemon):
+                    spinner.succeed(f"{file.filename} → {file.parsed_date}")
+            except Exception as e:
+                spinner.info(f"An error occurred: '{file.filename}': {str(e) or repr(e)}")
 
 
 if __name__ == '__main__':
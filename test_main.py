@@ -0,0 +1,50 @@
+from main import File, parse_filename_to_date
+
+
+def _parse(filename):
+    return parse_filename_to_date(File(filename=filename)).parsed_date
+
+
+def test_android_image_filename():
+    assert _parse('IMG-20230415-WA0001.jpg') == '2023:04:15 00:00:00'
+
+
+def test_android_video_filename():
+    assert _parse('VID-20230415-WA0002.mp4') == '2023:04:15 00:00:00'
+
+
+def test_ios_filename_with_time():
+    assert _parse('PHOTO-2023-04-15-at-10.30.15.jpeg') == '2023:04:15 10:30:15'
+
+
+def test_spaced_filename_with_time():
+    assert _parse('PHOTO 20230415 at 10.30.15.jpg') == '2023:04:15 10:30:15'
+
+
+def test_nineties_filename():
+    assert _parse('IMG-19981123-WA0007.jpg') == '1998:11:23 00:00:00'
+
+
+def test_two_dates_takes_leftmost():
+    assert _parse('IMG-19981123-20230415.jpg') == '1998:11:23 00:00:00'
+    assert _parse('IMG-20230415-19981123.jpg') == '2023:04:15 00:00:00'
+
+
+def test_undashed_date_before_dashed_takes_leftmost():
+    assert _parse('20230415-19981123.jpg') == '2023:04:15 00:00:00'
+
+
+def test_no_date_in_filename():
+    assert _parse('nodate.jpg') == ''
+
+
+def test_invalid_month_rejected():
+    assert _parse('IMG-20231345-WA0001.jpg') == ''
+
+
+def test_invalid_day_rejected():
+    assert _parse('IMG-20230432-WA0001.jpg') == ''
+
+
+def test_phone_number_not_parsed():
+    assert _parse('chat-15551234567.jpg') == ''